@@ -12,13 +12,20 @@
 from __future__ import annotations
 
 import ast
+import functools
+import hashlib
 import html
+import json
 import re
-from datetime import date, datetime
+import sys
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, FrozenSet, List, Set, Tuple
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pv
 import streamlit as st
 
 
@@ -27,13 +34,26 @@ import streamlit as st
 # -------------------
 DATA_PATH = Path("jpt_scraper/data/jpt.csv")
 ALL_TAGS_PATH = Path("all_tags.csv")  # must contain column: tag
+COUNTRIES_PATH = Path("jpt_scraper/data/countries.json")  # generated by scripts/gen_countries.py
+CACHE_DIR = Path(".cache")  # normalized-frame Feather side-cars
+CACHE_VERSION = "2"  # bump whenever build_frame changes the frame it produces
 PAGE_SIZE = 25
+FACETS = ["topics", "tags", "countries"]
+TEXT_COLS = ["url", "title", "excerpt", "topics", "tags"]
+STRING_DTYPE = pd.ArrowDtype(pa.string())
+DATE_TYPES = {"published_date": pa.timestamp("ns"), "scraped_at": pa.timestamp("ns", tz="UTC")}
 
 
 # -------------------
 # Normalization
 # -------------------
 WORD_SPLIT_RE = re.compile(r"(\s+|[-/])")  # keep separators
+WS_RE = re.compile(r"\s+")
+ACRO_TOKEN_RE = re.compile(r"[A-Za-z]{1,4}\d{1,3}|[A-Z]{2,}")  # e.g. "CO2", "H2S", "LNG"
+ACRO_TAG_RE = re.compile(r"[A-Z0-9&./-]{2,}")
+AMP_DOT_RE = re.compile(r"[&.]")
+ALPHA_RE = re.compile(r"[A-Za-z]")
+UPPER_RE = re.compile(r"[A-Z]")
 
 BASE_ACRONYMS = {
     "AI", "ML", "US", "UK", "UAE", "LNG", "CCS", "CO2", "CO₂", "M&A", "HSE", "OPEC",
@@ -66,6 +86,11 @@ def _normalize_text(x) -> str:
     return " ".join(str(x).split()).strip()
 
 
+def normalize_text_column(s: pd.Series) -> pd.Series:
+    # Vectorized _normalize_text over an Arrow-backed string column
+    return s.astype(STRING_DTYPE).str.replace(r"[\s\p{Z}]+", " ", regex=True).str.strip()
+
+
 def _parse_listish(value) -> list[str]:
     if value is None or (isinstance(value, float) and pd.isna(value)):
         return []
@@ -77,6 +102,15 @@ def _parse_listish(value) -> list[str]:
         return []
 
     if s.startswith("[") and s.endswith("]"):
+        # Fast path for "['A', 'B']": quote-swap and parse as JSON. Cells with
+        # double quotes or escapes can't be swapped safely and go to literal_eval.
+        if '"' not in s and "\\" not in s:
+            try:
+                parsed = json.loads(s.replace("'", '"'))
+                if isinstance(parsed, list):
+                    return [str(v).strip() for v in parsed if str(v).strip()]
+            except ValueError:
+                pass
         try:
             parsed = ast.literal_eval(s)
             if isinstance(parsed, list):
@@ -94,11 +128,9 @@ def _looks_like_acronym(token: str, acronyms: Set[str]) -> bool:
 
     if t.upper() in acronyms:
         return True
-    if re.fullmatch(r"[A-Za-z]{1,4}\d{1,3}", t):
-        return True
-    if re.fullmatch(r"[A-Z]{2,}", t):
+    if ACRO_TOKEN_RE.fullmatch(t):
         return True
-    if re.search(r"[&.]", t) and re.search(r"[A-Za-z]", t):
+    if AMP_DOT_RE.search(t) and ALPHA_RE.search(t):
         return True
 
     return False
@@ -129,7 +161,7 @@ def normalize_phrase(s: str, acronyms: Set[str]) -> str:
         return ""
     parts = WORD_SPLIT_RE.split(s)
     out = "".join(_smart_title_token(p, acronyms) for p in parts)
-    out = re.sub(r"\s+", " ", out).strip()
+    out = WS_RE.sub(" ", out).strip()
     out = out.replace("Co2", "CO2").replace("Co₂", "CO2")
     return out
 
@@ -149,9 +181,9 @@ def build_acronym_set(master_tags: List[str]) -> Set[str]:
         t = _normalize_text(t)
         if not t:
             continue
-        if re.fullmatch(r"[A-Z0-9&./-]{2,}", t) and re.search(r"[A-Z]", t):
+        if ACRO_TAG_RE.fullmatch(t) and UPPER_RE.search(t):
             acronyms.add(t.upper())
-        if re.search(r"[&.]", t) and re.search(r"[A-Za-z]", t):
+        if AMP_DOT_RE.search(t) and ALPHA_RE.search(t):
             acronyms.add(t.upper())
     return acronyms
 
@@ -170,36 +202,26 @@ def build_canonical_tag_map(master_tags: List[str], acronyms: Set[str]) -> Dict[
 # Countries
 # -------------------
 @st.cache_resource
-def build_country_set_cached() -> Set[str]:
+def build_country_set_cached() -> FrozenSet[str]:
     out: Set[str] = {"US", "UK", "UAE"}
     try:
-        import pycountry  # type: ignore
-
-        for c in pycountry.countries:
-            for name in [getattr(c, "name", None), getattr(c, "official_name", None), getattr(c, "common_name", None)]:
-                if not name:
-                    continue
-                out.add(COUNTRY_ABBREV.get(name, name))
-    except Exception:
+        names = json.loads(COUNTRIES_PATH.read_bytes())
+        out.update(COUNTRY_ABBREV.get(name, name) for name in names)
+    except (OSError, ValueError):
         out |= {
             "Canada", "Mexico", "Brazil", "Argentina", "Norway", "France", "Germany", "Italy", "Spain",
             "Australia", "India", "China", "Japan", "Saudi Arabia", "Qatar", "Kuwait", "Oman",
             "Iraq", "Iran", "Libya", "Nigeria", "Angola", "Egypt",
         }
-    return out
+    return frozenset(out)
 
 
-def canonical_country_from_tag(tag: str) -> str | None:
-    t = _normalize_text(tag)
-    if not t:
-        return None
-    if t in COUNTRY_ABBREV:
-        return COUNTRY_ABBREV[t]
-    tl = t.lower()
-    for k, v in COUNTRY_ABBREV.items():
-        if tl == k.lower():
-            return v
-    return None
+@st.cache_resource
+def build_tag_to_country_cached() -> Dict[str, str]:
+    # lowercased tag -> canonical country; COUNTRY_ABBREV wins over plain names
+    out = {c.lower(): c for c in build_country_set_cached()}
+    out.update({k.lower(): v for k, v in COUNTRY_ABBREV.items()})
+    return out
 
 
 # -------------------
@@ -227,140 +249,267 @@ def format_last_updated(csv_path: Path, df: pd.DataFrame) -> str:
 # -------------------
 # Data loading
 # -------------------
-@st.cache_data(ttl=60)
-def load_data(csv_path: str, master_tags_path: str) -> pd.DataFrame:
-    data_path = Path(csv_path)
-    if not data_path.exists():
-        return pd.DataFrame()
+# value -> sorted row positions holding it; one CSC-style column per distinct value
+FacetIndex = Dict[str, np.ndarray]
 
-    df = pd.read_csv(data_path)
 
-    expected = ["url", "title", "excerpt", "published_date", "topics", "tags", "scraped_at", "refresh_existing"]
-    for c in expected:
+def build_facet_index(lists: pd.Series) -> FacetIndex:
+    rows: Dict[str, List[int]] = {}
+    for i, xs in enumerate(lists.tolist()):
+        for x in set(xs or []):
+            rows.setdefault(x, []).append(i)
+    return {k: np.asarray(v, dtype=np.int64) for k, v in rows.items()}
+
+
+# Every column build_frame guarantees, source and derived
+CSV_COLUMNS = ["url", "title", "excerpt", "published_date", "topics", "tags", "scraped_at", "refresh_existing"]
+FRAME_COLUMNS = CSV_COLUMNS + ["search_text"] + [f"{c}_list" for c in FACETS]
+
+
+def file_signature(path: Path) -> Tuple[int, int]:
+    # (mtime_ns, size); changes whenever the file is rewritten
+    try:
+        info = path.stat()
+    except OSError:
+        return (0, 0)
+    return (info.st_mtime_ns, info.st_size)
+
+
+def frame_cache_path(*paths: Path) -> Path:
+    # Keyed on source signatures: a new CSV, all_tags.csv or countries.json gets a new side-car.
+    # CACHE_VERSION covers code-only changes to build_frame.
+    sig = "|".join([CACHE_VERSION] + [f"{p}:{file_signature(p)}" for p in paths])
+    key = hashlib.blake2b(sig.encode(), digest_size=8).hexdigest()
+    return CACHE_DIR / f"jpt_{key}.feather"
+
+
+def read_frame_cache(path: Path) -> pd.DataFrame | None:
+    if not path.exists():
+        return None
+    try:
+        df = pd.read_feather(path)
+    except Exception:
+        return None
+    # A side-car from older code may lack derived columns; rebuild instead
+    if not set(FRAME_COLUMNS).issubset(df.columns):
+        return None
+    # Arrow list<string> comes back as ndarray cells; the filters expect lists
+    for c in FACETS:
+        df[f"{c}_list"] = [list(xs) for xs in df[f"{c}_list"].to_numpy()]
+    return df
+
+
+def write_frame_cache(df: pd.DataFrame, path: Path) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        for old in path.parent.glob("jpt_*.feather"):
+            old.unlink(missing_ok=True)
+        tmp = path.with_suffix(".feather.tmp")
+        df.to_feather(tmp)
+        tmp.replace(path)
+    except OSError:
+        pass  # read-only checkout: just skip the side-car
+
+
+def read_news_csv(data_path: Path, date_types: Dict[str, pa.DataType]) -> pd.DataFrame:
+    # Multi-threaded Arrow parse; text stays in Arrow buffers instead of one PyObject per cell
+    tbl = pv.read_csv(
+        data_path,
+        parse_options=pv.ParseOptions(newlines_in_values=True),
+        convert_options=pv.ConvertOptions(
+            column_types={**{c: pa.string() for c in TEXT_COLS}, **date_types},
+            strings_can_be_null=False,
+        ),
+    )
+    return tbl.to_pandas(types_mapper={pa.string(): STRING_DTYPE}.get)
+
+
+def build_frame(data_path: Path, master_tags_path: Path) -> pd.DataFrame:
+    # The merge step writes ISO-8601 dates, so Arrow parses them straight to
+    # datetime64; a malformed cell falls back to text + coercion below.
+    try:
+        df = read_news_csv(data_path, DATE_TYPES)
+    except pa.ArrowInvalid:
+        df = read_news_csv(data_path, {})
+
+    for c in CSV_COLUMNS:
         if c not in df.columns:
             df[c] = ""
 
-    df["url"] = df["url"].map(_normalize_text)
-    df["title"] = df["title"].map(_normalize_text)
-    df["excerpt"] = df["excerpt"].map(_normalize_text)
-    df["published_date"] = pd.to_datetime(df["published_date"], errors="coerce").dt.date
-
-    df["topics_list_raw"] = df["topics"].map(_parse_listish)
-    df["tags_list_raw"] = df["tags"].map(_parse_listish)
+    df["url"] = normalize_text_column(df["url"])
+    df["title"] = normalize_text_column(df["title"])
+    df["excerpt"] = normalize_text_column(df["excerpt"])
+    # Lowercased haystack for keyword search, built once instead of per filter call
+    df["search_text"] = (df["title"] + " " + df["excerpt"]).str.lower()
+    for c, t in DATE_TYPES.items():
+        if not pd.api.types.is_datetime64_any_dtype(df[c]):
+            df[c] = pd.to_datetime(df[c], errors="coerce", format="ISO8601", utc=t.tz is not None)
 
-    master_tags = load_master_tags(Path(master_tags_path))
+    master_tags = load_master_tags(master_tags_path)
     acronyms = build_acronym_set(master_tags)
     canon_map = build_canonical_tag_map(master_tags, acronyms)
 
+    # Tags/topics repeat across thousands of rows: normalize each distinct raw
+    # string once, and intern the result so every row shares one str object.
+    @functools.lru_cache(maxsize=None)
     def norm_tag(x: str) -> str:
         x0 = _normalize_text(x)
         if not x0:
             return ""
         key = x0.lower()
         if key in canon_map:
-            return canon_map[key]
-        return normalize_phrase(x0, acronyms)
+            return sys.intern(canon_map[key])
+        return sys.intern(normalize_phrase(x0, acronyms))
 
-    df["tags_list"] = df["tags_list_raw"].apply(
-        lambda xs: [norm_tag(t) for t in (xs or []) if norm_tag(t)]
-    )
+    @functools.lru_cache(maxsize=None)
+    def norm_topic(x: str) -> str:
+        return sys.intern(normalize_phrase(_normalize_text(x), acronyms))
 
-    df["topics_list"] = df["topics_list_raw"].apply(
-        lambda xs: [normalize_phrase(_normalize_text(t), acronyms) for t in (xs or []) if _normalize_text(t)]
-    )
+    # Parse + normalize in one pass per cell; no intermediate raw-list columns
+    def parse_and_norm(value, norm) -> List[str]:
+        return [n for n in map(norm, _parse_listish(value)) if n]
+
+    df["tags_list"] = [parse_and_norm(v, norm_tag) for v in df["tags"].to_numpy()]
+    df["topics_list"] = [parse_and_norm(v, norm_topic) for v in df["topics"].to_numpy()]
 
-    df = df[df["url"].astype(bool)].copy()
+    df = df[df["url"] != ""].copy()
     df = df.drop_duplicates(subset=["url"], keep="last")
     df = df.sort_values("published_date", ascending=False, na_position="last").reset_index(drop=True)
 
-    country_set = build_country_set_cached()
+    tag_to_country = build_tag_to_country_cached()
 
     def countries_from_tags(tags: List[str]) -> List[str]:
-        found: Set[str] = set()
-        for t in tags or []:
-            c = canonical_country_from_tag(t)
-            if c:
-                found.add(c)
-        for t in tags or []:
-            if t in country_set:
-                found.add(t)
-        return sorted(found)
-
-    df["countries_list"] = df["tags_list"].apply(countries_from_tags)
+        return sorted({tag_to_country[k] for k in (t.lower() for t in tags or []) if k in tag_to_country})
+
+    df["countries_list"] = [countries_from_tags(tags) for tags in df["tags_list"].to_numpy()]
     return df
 
 
+# No TTL: csv_sig/tags_sig are part of the cache key, so the entry lives
+# exactly until one of the files changes on disk.
+@st.cache_data(show_spinner=False)
+def load_data(
+    csv_path: str,
+    master_tags_path: str,
+    csv_sig: Tuple[int, int],
+    tags_sig: Tuple[int, int],
+) -> Tuple[pd.DataFrame, Dict[str, FacetIndex]]:
+    data_path = Path(csv_path)
+    if not data_path.exists():
+        return pd.DataFrame(), {}
+
+    tags_path = Path(master_tags_path)
+    cache_path = frame_cache_path(data_path, tags_path, COUNTRIES_PATH)
+    df = read_frame_cache(cache_path)
+    if df is None:
+        df = build_frame(data_path, tags_path)
+        write_frame_cache(df, cache_path)
+
+    facets = {c: build_facet_index(df[f"{c}_list"]) for c in FACETS}
+    return df, facets
+
+
 # -------------------
 # Filtering
 # -------------------
-def match_keywords(text: str, keywords: list[str], any_mode: bool) -> bool:
-    if not keywords:
-        return True
-    t = (text or "").lower()
-    ks = [k.lower() for k in keywords]
-    return any(k in t for k in ks) if any_mode else all(k in t for k in ks)
+def keyword_regex(keywords: tuple[str, ...]) -> str:
+    # One alternation matches all keywords in a single pass (OR mode)
+    return "|".join(re.escape(k.lower()) for k in keywords)
 
 
-def must_include_all(selected: list[str], row_values: list[str]) -> bool:
-    if not selected:
-        return True
-    row_set = set(row_values or [])
-    return all(s in row_set for s in selected)
+def match_keywords(text_lower: pd.Series, keywords: list[str], any_mode: bool) -> pd.Series:
+    if not keywords:
+        return pd.Series(True, index=text_lower.index)
+    if any_mode:
+        return text_lower.str.contains(keyword_regex(tuple(keywords)), regex=True)
+    mask = pd.Series(True, index=text_lower.index)
+    for k in keywords:
+        mask &= text_lower.str.contains(k.lower(), regex=False)
+    return mask
 
 
-def must_include_any(selected: list[str], row_values: list[str]) -> bool:
-    if not selected:
-        return True
-    row_set = set(row_values or [])
-    return any(s in row_set for s in selected)
+# Per-filter masks persist across reruns and sessions. The underscore args are
+# skipped by Streamlit's hasher; data_sig (plus the facet name) identifies them.
+# cache_resource hands out the cached array itself, so masks are read-only;
+# callers combine them into fresh arrays.
+def frozen(mask: np.ndarray) -> np.ndarray:
+    mask.flags.writeable = False
+    return mask
 
 
-def apply_match(selected: list[str], row_values: list[str], mode: str) -> bool:
+@st.cache_resource(show_spinner=False, max_entries=64)
+def compute_date_mask(_df: pd.DataFrame, data_sig: tuple, start_d: date, end_d: date) -> np.ndarray:
+    # build_frame sorts published_date descending with NaT last, so the dated rows
+    # form one sorted run: binary-search both bounds and fill a contiguous slice.
+    dates = _df["published_date"].to_numpy(dtype="datetime64[ns]")
+    n_dated = len(dates) - int(np.isnat(dates).sum())
+    asc = dates[:n_dated][::-1]
+    lo = int(np.searchsorted(asc, np.datetime64(start_d, "ns"), side="left"))
+    # Exclusive upper bound at the next midnight keeps every time of day on end_d
+    hi = int(np.searchsorted(asc, np.datetime64(end_d + timedelta(days=1), "ns"), side="left"))
+    mask = np.zeros(len(dates), dtype=bool)
+    mask[n_dated - hi:n_dated - lo] = True
+    return frozen(mask)
+
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+def compute_keyword_mask(
+    _df: pd.DataFrame, data_sig: tuple, keywords: tuple[str, ...], any_mode: bool
+) -> np.ndarray:
+    return frozen(match_keywords(_df["search_text"], list(keywords), any_mode).to_numpy(dtype=bool))
+
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+def compute_facet_mask(
+    _index: FacetIndex, data_sig: tuple, facet: str, n_rows: int, selected: tuple[str, ...], mode: str
+) -> np.ndarray:
     # mode: "OR" or "AND"
+    if not selected:
+        return frozen(np.ones(n_rows, dtype=bool))
+    cols = [_index.get(v) for v in dict.fromkeys(selected)]
     if mode == "AND":
-        return must_include_all(selected, row_values)
-    return must_include_any(selected, row_values)
+        if any(c is None for c in cols):
+            return frozen(np.zeros(n_rows, dtype=bool))
+        return frozen(np.bincount(np.concatenate(cols), minlength=n_rows) == len(cols))
+    mask = np.zeros(n_rows, dtype=bool)
+    for c in cols:
+        if c is not None:
+            mask[c] = True
+    return frozen(mask)
 
 
 def available_values_from_subset(subset: pd.DataFrame, col_list: str) -> list[str]:
-    values: set[str] = set()
-    for xs in subset[col_list].tolist():
-        for x in xs or []:
-            values.add(x)
-    return sorted(values)
+    values = subset[col_list].explode().dropna().unique()
+    values.sort()
+    return values.tolist()
 
 
-def apply_filters(
+def compute_submasks(
     df: pd.DataFrame,
+    facets: Dict[str, FacetIndex],
+    data_sig: tuple,
     start_d: date,
     end_d: date,
     keyword_list: list[str],
     any_mode: bool,
-    selected_topics: list[str],
-    selected_tags: list[str],
-    selected_countries: list[str],
-    topics_mode: str,
-    tags_mode: str,
-    countries_mode: str,
-) -> pd.Series:
-    mask = pd.Series(True, index=df.index)
-
-    mask &= df["published_date"].between(start_d, end_d, inclusive="both")
+    selections: Dict[str, Tuple[list[str], str]],
+) -> Dict[str, np.ndarray]:
+    # selections: facet -> (selected values, "OR"/"AND"); unselected facets add no mask
+    submasks = {"date": compute_date_mask(df, data_sig, start_d, end_d)}
 
     if keyword_list:
-        combined = (df["title"].fillna("") + " " + df["excerpt"].fillna("")).astype(str)
-        mask &= combined.apply(lambda t: match_keywords(t, keyword_list, any_mode))
+        submasks["keywords"] = compute_keyword_mask(df, data_sig, tuple(keyword_list), any_mode)
 
-    if selected_topics:
-        mask &= df["topics_list"].apply(lambda xs: apply_match(selected_topics, xs, topics_mode))
+    for c in FACETS:
+        selected, mode = selections[c]
+        if selected:
+            submasks[c] = compute_facet_mask(facets[c], data_sig, c, len(df), tuple(selected), mode)
 
-    if selected_tags:
-        mask &= df["tags_list"].apply(lambda xs: apply_match(selected_tags, xs, tags_mode))
+    return submasks
 
-    if selected_countries:
-        mask &= df["countries_list"].apply(lambda xs: apply_match(selected_countries, xs, countries_mode))
 
-    return mask
+def combine_submasks(submasks: Dict[str, np.ndarray], exclude: str | None = None) -> np.ndarray:
+    return np.logical_and.reduce([m for k, m in submasks.items() if k != exclude])
 
 
 def make_html_link(url: str, title: str) -> str:
@@ -369,6 +518,55 @@ def make_html_link(url: str, title: str) -> str:
     return f'<a href="{u}" target="_blank" rel="noopener noreferrer">{t}</a>'
 
 
+TABLE_HEAD = "<table><thead><tr>" + "".join(
+    f"<th>{c}</th>" for c in ["Date", "Article", "Countries", "Topics", "Tags", "Excerpt"]
+) + "</tr></thead><tbody>"
+TABLE_TAIL = "</tbody></table>"
+
+
+def render_table_html(page_df: pd.DataFrame) -> str:
+    # One pass over the page rows; every text cell is escaped, only the link is raw HTML
+    esc = html.escape
+    rows = zip(
+        page_df["published_date"].astype(str),
+        page_df["url"],
+        page_df["title"],
+        page_df["countries_list"],
+        page_df["topics_list"],
+        page_df["tags_list"],
+        page_df["excerpt"],
+    )
+    body = "".join(
+        f"<tr><td>{esc(d)}</td><td>{make_html_link(u, t)}</td><td>{esc(', '.join(cs))}</td>"
+        f"<td>{esc(', '.join(tps))}</td><td>{esc(', '.join(tgs))}</td><td>{esc(ex)}</td></tr>"
+        for d, u, t, cs, tps, tgs, ex in rows
+    )
+    return TABLE_HEAD + body + TABLE_TAIL
+
+
+# The underscore args are skipped by Streamlit's hasher; filter_key (data
+# signature + all filter inputs) fully determines them.
+@st.cache_data(show_spinner=False, max_entries=64)
+def cached_page_html(_page_df: pd.DataFrame, filter_key: tuple, page: int) -> str:
+    return render_table_html(_page_df)
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def cached_results_csv(_results: pd.DataFrame, filter_key: tuple) -> bytes:
+    download_df = _results.copy()
+    for c in FACETS:
+        download_df[c] = [", ".join(xs) for xs in download_df[f"{c}_list"].to_numpy()]
+
+    cols_out = [
+        c for c in [
+            "published_date", "url", "title", "excerpt",
+            "topics", "tags", "countries", "scraped_at"
+        ]
+        if c in download_df.columns
+    ]
+    return download_df[cols_out].to_csv(index=False).encode("utf-8")
+
+
 # -------------------
 # UI
 # -------------------
@@ -382,7 +580,8 @@ if not DATA_PATH.exists():
     )
     st.stop()
 
-df = load_data(str(DATA_PATH), str(ALL_TAGS_PATH))
+data_sig = (file_signature(DATA_PATH), file_signature(ALL_TAGS_PATH))
+df, facets = load_data(str(DATA_PATH), str(ALL_TAGS_PATH), *data_sig)
 st.info(format_last_updated(DATA_PATH, df))
 
 if df.empty:
@@ -396,10 +595,13 @@ st.caption(
 
 min_date = df["published_date"].min()
 max_date = df["published_date"].max()
-if pd.isna(min_date) or min_date is None:
-    min_date = date(2000, 1, 1)
-if pd.isna(max_date) or max_date is None:
-    max_date = date.today()
+min_date = date(2000, 1, 1) if pd.isna(min_date) else min_date.date()
+max_date = date.today() if pd.isna(max_date) else max_date.date()
+
+
+def session_selections() -> Dict[str, Tuple[list[str], str]]:
+    return {c: (st.session_state[f"selected_{c}"], st.session_state[f"{c}_mode"]) for c in FACETS}
+
 
 for key in ["selected_topics", "selected_tags", "selected_countries", "topics_mode", "tags_mode", "countries_mode"]:
     if key not in st.session_state:
@@ -439,20 +641,13 @@ with st.sidebar:
 
     st.divider()
 
+    # Each facet's options come from every submask except its own. Submasks are
+    # re-collected after each multiselect since pruning may change a selection;
+    # the per-filter masks are cached, so unchanged ones are cache hits.
+
     # Topics depend on everything except topics
-    mask_topics = apply_filters(
-        df=df,
-        start_d=start_d,
-        end_d=end_d,
-        keyword_list=keyword_list,
-        any_mode=any_mode,
-        selected_topics=[],
-        selected_tags=st.session_state.selected_tags,
-        selected_countries=st.session_state.selected_countries,
-        topics_mode=st.session_state.topics_mode,
-        tags_mode=st.session_state.tags_mode,
-        countries_mode=st.session_state.countries_mode,
-    )
+    submasks = compute_submasks(df, facets, data_sig, start_d, end_d, keyword_list, any_mode, session_selections())
+    mask_topics = combine_submasks(submasks, exclude="topics")
     avail_topics = available_values_from_subset(df[mask_topics], "topics_list")
     st.session_state.selected_topics = [t for t in st.session_state.selected_topics if t in avail_topics]
     st.multiselect(
@@ -462,19 +657,8 @@ with st.sidebar:
     )
 
     # Tags depend on everything except tags
-    mask_tags = apply_filters(
-        df=df,
-        start_d=start_d,
-        end_d=end_d,
-        keyword_list=keyword_list,
-        any_mode=any_mode,
-        selected_topics=st.session_state.selected_topics,
-        selected_tags=[],
-        selected_countries=st.session_state.selected_countries,
-        topics_mode=st.session_state.topics_mode,
-        tags_mode=st.session_state.tags_mode,
-        countries_mode=st.session_state.countries_mode,
-    )
+    submasks = compute_submasks(df, facets, data_sig, start_d, end_d, keyword_list, any_mode, session_selections())
+    mask_tags = combine_submasks(submasks, exclude="tags")
     avail_tags = available_values_from_subset(df[mask_tags], "tags_list")
     st.session_state.selected_tags = [t for t in st.session_state.selected_tags if t in avail_tags]
     st.multiselect(
@@ -484,19 +668,8 @@ with st.sidebar:
     )
 
     # Countries depend on everything except countries
-    mask_countries = apply_filters(
-        df=df,
-        start_d=start_d,
-        end_d=end_d,
-        keyword_list=keyword_list,
-        any_mode=any_mode,
-        selected_topics=st.session_state.selected_topics,
-        selected_tags=st.session_state.selected_tags,
-        selected_countries=[],
-        topics_mode=st.session_state.topics_mode,
-        tags_mode=st.session_state.tags_mode,
-        countries_mode=st.session_state.countries_mode,
-    )
+    submasks = compute_submasks(df, facets, data_sig, start_d, end_d, keyword_list, any_mode, session_selections())
+    mask_countries = combine_submasks(submasks, exclude="countries")
     avail_countries = available_values_from_subset(df[mask_countries], "countries_list")
     st.session_state.selected_countries = [c for c in st.session_state.selected_countries if c in avail_countries]
     st.multiselect(
@@ -508,18 +681,20 @@ with st.sidebar:
     st.divider()
     st.caption("Tip: your GitHub Action / scheduler updates the CSV. Refresh this page to see new data.")
 
-final_mask = apply_filters(
-    df=df,
-    start_d=start_d,
-    end_d=end_d,
-    keyword_list=keyword_list,
-    any_mode=any_mode,
-    selected_topics=st.session_state.selected_topics,
-    selected_tags=st.session_state.selected_tags,
-    selected_countries=st.session_state.selected_countries,
-    topics_mode=st.session_state.topics_mode,
-    tags_mode=st.session_state.tags_mode,
-    countries_mode=st.session_state.countries_mode,
+selections = session_selections()
+submasks = compute_submasks(df, facets, data_sig, start_d, end_d, keyword_list, any_mode, selections)
+final_mask = combine_submasks(submasks)
+
+# Hashable identity of this result set: data version + every filter input.
+# Page changes rerun the script with the same key, so the rendered page and
+# the download CSV below come straight from cache.
+filter_key = (
+    data_sig,
+    start_d,
+    end_d,
+    tuple(keyword_list),
+    any_mode,
+    tuple((c, tuple(sel), mode) for c, (sel, mode) in selections.items()),
 )
 
 results = df[final_mask].copy()
@@ -544,15 +719,7 @@ with colC:
 
 start_i = (page - 1) * PAGE_SIZE
 end_i = start_i + PAGE_SIZE
-page_df = results.iloc[start_i:end_i].copy()
-
-page_df["Date"] = page_df["published_date"].astype(str)
-page_df["Countries"] = page_df["countries_list"].apply(lambda xs: ", ".join(xs or []))
-page_df["Topics"] = page_df["topics_list"].apply(lambda xs: ", ".join(xs or []))
-page_df["Tags"] = page_df["tags_list"].apply(lambda xs: ", ".join(xs or []))
-page_df["Article"] = page_df.apply(lambda r: make_html_link(r["url"], r["title"]), axis=1)
-
-table = page_df[["Date", "Article", "Countries", "Topics", "Tags", "excerpt"]].rename(columns={"excerpt": "Excerpt"})
+page_df = results.iloc[start_i:end_i]
 
 css = """
 <style>
@@ -575,27 +742,14 @@ tbody td:first-child, thead th:first-child {
 """
 
 st.markdown(css, unsafe_allow_html=True)
-st.write(table.to_html(escape=False, index=False), unsafe_allow_html=True)
+st.write(cached_page_html(page_df, filter_key, page), unsafe_allow_html=True)
 
 st.caption(f"Showing rows {start_i + 1}-{min(end_i, total_rows)} of {total_rows}.")
 
 # Download filtered results (all rows, not just this page)
-download_df = results.copy()
-download_df["topics"] = download_df["topics_list"].apply(lambda xs: ", ".join(xs or []))
-download_df["tags"] = download_df["tags_list"].apply(lambda xs: ", ".join(xs or []))
-download_df["countries"] = download_df["countries_list"].apply(lambda xs: ", ".join(xs or []))
-
-cols_out = [
-    c for c in [
-        "published_date", "url", "title", "excerpt",
-        "topics", "tags", "countries", "scraped_at"
-    ]
-    if c in download_df.columns
-]
-
 st.download_button(
     "Download filtered results (CSV)",
-    data=download_df[cols_out].to_csv(index=False).encode("utf-8"),
+    data=cached_results_csv(results, filter_key),
     file_name="jpt_filtered.csv",
     mime="text/csv",
 )
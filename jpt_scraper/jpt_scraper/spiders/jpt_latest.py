@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-import csv
 import re
 from datetime import datetime, timezone
 from pathlib import Path
 
+import pyarrow as pa
+import pyarrow.csv as pacsv
 import scrapy
 from dateutil import parser as dateparser
 
@@ -41,6 +42,23 @@ def clean_list(xs) -> list[str]:
     return out
 
 
+def read_csv_column(path: Path, column: str) -> list[str]:
+    """
+    Reads one column of the master CSV as stripped, non-empty strings.
+    Arrow only converts the requested column, so the long excerpts are
+    tokenized but never materialized as Python strings.
+    """
+    table = pacsv.read_csv(
+        path,
+        parse_options=pacsv.ParseOptions(newlines_in_values=True),
+        convert_options=pacsv.ConvertOptions(
+            include_columns=[column], column_types={column: pa.string()}
+        ),
+    )
+    values = (v.strip() for v in table.column(column).to_pylist() if v)
+    return [v for v in values if v]
+
+
 def read_last_date_from_csv(csv_path: str | None) -> str | None:
     """
     Reads max(published_date) from existing master CSV.
@@ -54,14 +72,29 @@ def read_last_date_from_csv(csv_path: str | None) -> str | None:
         return None
 
     try:
-        with path.open(newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            dates = [r.get("published_date") for r in reader if r.get("published_date")]
+        dates = read_csv_column(path, "published_date")
         return max(dates) if dates else None
     except Exception:
         return None
 
 
+def read_known_urls_from_csv(csv_path: str | None) -> set[str]:
+    """
+    Reads the set of article URLs already in the master CSV.
+    """
+    if not csv_path:
+        return set()
+
+    path = Path(csv_path)
+    if not path.exists():
+        return set()
+
+    try:
+        return set(read_csv_column(path, "url"))
+    except Exception:
+        return set()
+
+
 class JptLatestSpider(scrapy.Spider):
     name = "jpt_latest"
     allowed_domains = ["jpt.spe.org"]
@@ -91,15 +124,15 @@ class JptLatestSpider(scrapy.Spider):
           - otherwise crawl at most this many listing pages
 
         refresh_existing:
-          - 0 = normal
-          - 1 = force refresh (if you later add upsert logic)
+          - 0 = normal: skip article pages whose URL is already in csv_path
+          - 1 = force refresh: re-scrape known articles too
 
         stop_at_last_date:
           - 0 = off
           - 1 = stop paging when listing reaches articles <= last_date in csv_path
 
         csv_path:
-          - path to master CSV (used to compute last_date)
+          - path to master CSV (used to compute last_date and the known URLs)
         """
         super().__init__(*args, **kwargs)
         self.max_pages = int(max_pages)
@@ -112,6 +145,12 @@ class JptLatestSpider(scrapy.Spider):
         if self.last_date:
             self.logger.info(f"Hard stop enabled. Last date in CSV: {self.last_date}")
 
+        # Known articles are already in the master; fetching them again only
+        # produces rows the merge would dedup away
+        self.known_urls = set() if self.refresh_existing else read_known_urls_from_csv(csv_path)
+        if self.known_urls:
+            self.logger.info(f"Skipping {len(self.known_urls)} known URLs from CSV.")
+
     def parse(self, response: scrapy.http.Response):
         self.pages_seen += 1
 
@@ -138,6 +177,9 @@ class JptLatestSpider(scrapy.Spider):
                 )
                 return
 
+            if url in self.known_urls:
+                continue
+
             yield response.follow(
                 url,
                 callback=self.parse_article,
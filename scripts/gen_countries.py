@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pycountry  # type: ignore
+
+
+# -------------------
+# PATHS
+# -------------------
+SCRIPTS_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPTS_DIR.parent
+
+DATA_DIR = REPO_ROOT / "jpt_scraper" / "data"
+COUNTRIES_JSON = DATA_DIR / "countries.json"   # read by app.py
+
+
+def main() -> None:
+    names: set[str] = set()
+    for c in pycountry.countries:
+        for name in [getattr(c, "name", None), getattr(c, "official_name", None), getattr(c, "common_name", None)]:
+            if name:
+                names.add(name)
+
+    COUNTRIES_JSON.write_text(json.dumps(sorted(names), ensure_ascii=False, indent=0) + "\n", encoding="utf-8")
+    print(f"Countries written: {COUNTRIES_JSON} ({len(names)} names)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
 
 
 # -------------------
@@ -17,19 +22,109 @@ MASTER_CSV = DATA_DIR / "jpt_master.csv"   # NEVER touched
 DAILY_CSV = DATA_DIR / "jpt_daily.csv"     # Overwritten daily
 MERGED_CSV = DATA_DIR / "jpt.csv"           # Rebuilt every run
 
+TEXT_COLS = ["url", "title", "excerpt", "topics", "tags"]
+DATE_COLS = ["published_date", "scraped_at"]
+
+# Known schema: read text and dates as plain strings (dates are parsed once,
+# after the concat) so Arrow skips type inference on every block
+COLUMN_TYPES = {c: pa.string() for c in TEXT_COLS + DATE_COLS}
+
+
+def normalize_header(names) -> list[str]:
+    return [str(c).strip().lstrip("\ufeff") for c in names]
+
+
+def normalize_table(table: pa.Table) -> pa.Table:
+    # Trim header BOM/whitespace and text cells, so "url " and "url" dedup as one article.
+    # utf8_trim_whitespace runs once per column in C, before any Python objects exist.
+    names = normalize_header(table.column_names)
+    columns = [
+        pc.utf8_trim_whitespace(col) if name in TEXT_COLS and pa.types.is_string(col.type) else col
+        for name, col in zip(names, table.columns)
+    ]
+    return pa.Table.from_arrays(columns, names=names)
+
+
+def normalize_frame(df: pd.DataFrame) -> pd.DataFrame:
+    # Same as normalize_table, for the C-parser fallback
+    df.columns = normalize_header(df.columns)
+    cols = [c for c in df.columns if c in TEXT_COLS and df[c].dtype == object]
+    if cols:
+        df[cols] = df[cols].apply(lambda s: s.str.strip())
+    return df
+
+
+def read_table(path: Path) -> pa.Table:
+    # Multi-threaded Arrow parser with an explicit schema; excerpts may span lines
+    table = pacsv.read_csv(
+        path,
+        read_options=pacsv.ReadOptions(block_size=8 << 20),
+        parse_options=pacsv.ParseOptions(newlines_in_values=True),
+        convert_options=pacsv.ConvertOptions(
+            column_types=COLUMN_TYPES, strings_can_be_null=True
+        ),
+    )
+    return normalize_table(table)
+
+
+def parse_iso_datetime(s: pd.Series) -> pd.Series:
+    # format="ISO8601" takes pandas' vectorized ISO parser for every row, and
+    # accepts both "T" and " " separators (the scraper and to_csv differ).
+    return pd.to_datetime(s, errors="coerce", format="ISO8601", cache=True)
+
+
+def empty_frame() -> pd.DataFrame:
+    return pd.DataFrame(columns=list(COLUMN_TYPES))
+
 
 def load_csv(path: Path, label: str) -> pd.DataFrame:
     if not path.exists():
         print(f"{label} not found: {path} (using empty)")
         return pd.DataFrame()
-    df = pd.read_csv(path)
+    if path.stat().st_size == 0:
+        # Scrapy's -O export writes a 0-byte file when the crawl yields no items
+        # (e.g. every listed article is already in MASTER)
+        print(f"{label} is empty: {path} (no rows)")
+        return empty_frame()
+    try:
+        df = read_table(path).to_pandas()
+    except pa.ArrowInvalid:
+        try:
+            df = normalize_frame(pd.read_csv(path))
+        except pd.errors.EmptyDataError:
+            df = empty_frame()
     print(f"{label} loaded: {len(df)} rows")
     return df
 
 
+def latest_row_per_url(urls: np.ndarray, scraped_ns: np.ndarray) -> np.ndarray:
+    """
+    One hashed groupby pass instead of sort + drop_duplicates: positions of the
+    newest scraped_at per URL. Later rows win ties (DAILY comes after MASTER),
+    and NaT (int64 min) counts as oldest.
+    """
+    # idxmax keeps the first maximum, so group the rows in reverse order
+    rev = pd.Series(scraped_ns[::-1], index=np.arange(len(urls))[::-1])
+    best = rev.groupby(urls[::-1], sort=False, dropna=False).idxmax()
+    return np.sort(best.to_numpy())
+
+
+def descending_order(keys: list[np.ndarray]) -> np.ndarray:
+    """
+    Stable newest-first order over int64 datetime views, first key primary.
+    One lexsort and a single gather instead of a multi-column sort_values.
+    ~x reverses the order without overflowing, and sends NaT (int64 min) last.
+    """
+    return np.lexsort([~k for k in reversed(keys)])
+
+
 def main() -> None:
-    master_df = load_csv(MASTER_CSV, "MASTER")
-    daily_df = load_csv(DAILY_CSV, "DAILY")
+    # The two reads are independent and the Arrow parser releases the GIL,
+    # so overlap them
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        master_fut = ex.submit(load_csv, MASTER_CSV, "MASTER")
+        daily_fut = ex.submit(load_csv, DAILY_CSV, "DAILY")
+        master_df, daily_df = master_fut.result(), daily_fut.result()
 
     if master_df.empty and daily_df.empty:
         raise RuntimeError("Both MASTER and DAILY are empty. Nothing to merge.")
@@ -38,29 +133,40 @@ def main() -> None:
         if not df.empty and "url" not in df.columns:
             raise ValueError(f"{name} CSV missing required 'url' column.")
 
-    # Combine: MASTER first, DAILY second
-    combined = pd.concat([master_df, daily_df], ignore_index=True)
-
-    # Normalize datetimes if present
-    if "scraped_at" in combined.columns:
-        combined["scraped_at"] = pd.to_datetime(combined["scraped_at"], errors="coerce")
-        combined = combined.sort_values("scraped_at", ascending=True, kind="mergesort")
-
-    # Deduplicate so DAILY wins on conflicts
-    merged = combined.drop_duplicates(subset=["url"], keep="last")
-
-    # Optional final ordering
+    # Combine: MASTER first, DAILY second. Release the inputs right away and
+    # work on this one frame in place, so only a single full copy is alive.
+    # On a "nothing new" run one side is empty: use the other as-is, no concat.
+    frames = [df for df in (master_df, daily_df) if not df.empty]
+    # sort=False keeps the scraper's column order without a label sort; copy=False
+    # lets pandas skip the defensive copy where the blocks allow it
+    if len(frames) == 1:
+        merged = frames[0]
+    else:
+        merged = pd.concat(frames, ignore_index=True, sort=False, copy=False)
+    del master_df, daily_df, frames
+
+    # Deduplicate so the newest scrape (DAILY on ties) wins on conflicts.
+    # Dates stay strings until here and are parsed once, on the combined frame,
+    # so both inputs share one dtype and timezone.
+    if "scraped_at" in merged.columns:
+        merged["scraped_at"] = parse_iso_datetime(merged["scraped_at"])
+        scraped_ns = merged["scraped_at"].to_numpy(dtype="datetime64[ns]").view("i8")
+        merged = merged.iloc[latest_row_per_url(merged["url"].to_numpy(), scraped_ns)]
+    else:
+        merged.drop_duplicates(subset=["url"], keep="last", inplace=True)
+
+    # Optional final ordering: newest published first, then newest scrape
     if "published_date" in merged.columns:
-        merged["published_date"] = pd.to_datetime(merged["published_date"], errors="coerce")
-        sort_cols = ["published_date"] + (["scraped_at"] if "scraped_at" in merged.columns else [])
-        asc = [False] + ([False] if "scraped_at" in merged.columns else [])
-        merged = merged.sort_values(sort_cols, ascending=asc, kind="mergesort")
-    elif "scraped_at" in merged.columns:
-        merged = merged.sort_values("scraped_at", ascending=False, kind="mergesort")
-
-    # Atomic write (merged only)
+        merged["published_date"] = parse_iso_datetime(merged["published_date"])
+    sort_cols = [c for c in DATE_COLS if c in merged.columns]
+    if sort_cols:
+        keys = [merged[c].to_numpy(dtype="datetime64[ns]").view("i8") for c in sort_cols]
+        merged = merged.iloc[descending_order(keys)]
+
+    # Atomic write (merged only), through a 1 MiB buffer to cut write() calls
     tmp = MERGED_CSV.with_suffix(".csv.tmp")
-    merged.to_csv(tmp, index=False)
+    with open(tmp, "w", buffering=1 << 20, encoding="utf-8", newline="") as f:
+        merged.to_csv(f, index=False, lineterminator="\n")
     tmp.replace(MERGED_CSV)
 
     print(f"Merged written: {MERGED_CSV}")
@@ -14,6 +14,7 @@ REPO_ROOT = SCRIPTS_DIR.parent
 SCRAPY_ROOT = REPO_ROOT / "jpt_scraper"
 DATA_DIR = SCRAPY_ROOT / "data"
 
+MASTER_CSV = DATA_DIR / "jpt_master.csv"
 DAILY_CSV = DATA_DIR / "jpt_daily.csv"
 
 # -------------------
@@ -21,18 +22,22 @@ DAILY_CSV = DATA_DIR / "jpt_daily.csv"
 # -------------------
 SPIDER_NAME = os.getenv("SPIDER_NAME", "jpt_latest")
 MAX_PAGES = int(os.getenv("MAX_PAGES", "10"))
+# 0: only scrape articles missing from MASTER; 1: re-scrape everything listed
+REFRESH_EXISTING = int(os.getenv("REFRESH_EXISTING", "0"))
+# 1: run merge_three_way in this process once the scrape finishes
+MERGE = int(os.getenv("MERGE", "0"))
 
 
 def main() -> None:
     DATA_DIR.mkdir(parents=True, exist_ok=True)
 
-    if DAILY_CSV.exists():
-        DAILY_CSV.unlink()
+    DAILY_CSV.unlink(missing_ok=True)
 
     print("--- Scrape step (daily only) ---")
     print(f"Scrapy root: {SCRAPY_ROOT}")
     print(f"Spider:      {SPIDER_NAME}")
     print(f"MAX_PAGES:   {MAX_PAGES}")
+    print(f"Refresh:     {REFRESH_EXISTING}")
     print(f"Output:      {DAILY_CSV}")
 
     cmd = [
@@ -41,12 +46,24 @@ def main() -> None:
         SPIDER_NAME,
         "-a",
         f"max_pages={MAX_PAGES}",
+        "-a",
+        f"refresh_existing={REFRESH_EXISTING}",
+        "-a",
+        f"csv_path={MASTER_CSV}",
         "-O",
         str(DAILY_CSV),
     ]
 
     subprocess.run(cmd, cwd=str(SCRAPY_ROOT), check=True)
 
+    if MERGE:
+        # Same interpreter: no second Python/pandas startup, and DAILY is
+        # read back while it is still in the page cache
+        import merge_three_way
+
+        print("--- Merge step ---")
+        merge_three_way.main()
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,136 @@
+import importlib.util
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "merge_three_way.py"
+
+spec = importlib.util.spec_from_file_location("merge_three_way", SCRIPT)
+merge_three_way = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(merge_three_way)
+
+MASTER_ROWS = """excerpt,published_date,refresh_existing,scraped_at,tags,title,topics,url
+First,2026-02-02,0,2026-02-06T22:00:23+00:00,"SPE News",One,"HSE",https://jpt.spe.org/one
+Second,2026-02-03,0,2026-02-06T22:00:24+00:00,"Shale",Two,"Energy",https://jpt.spe.org/two
+"""
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    for name in ["MASTER_CSV", "DAILY_CSV", "MERGED_CSV"]:
+        monkeypatch.setattr(merge_three_way, name, tmp_path / getattr(merge_three_way, name).name)
+    return tmp_path
+
+
+@pytest.mark.parametrize("content", ["", "\n"])
+def test_load_csv_empty_file(tmp_path, content):
+    path = tmp_path / "jpt_daily.csv"
+    path.write_text(content)
+    df = merge_three_way.load_csv(path, "DAILY")
+    assert df.empty
+    assert {"url", "scraped_at", "published_date"} <= set(df.columns)
+
+
+def test_main_with_no_new_items_rebuilds_from_master(data_dir):
+    (data_dir / "jpt_master.csv").write_text(MASTER_ROWS)
+    (data_dir / "jpt_daily.csv").write_bytes(b"")  # what scrapy -O writes for zero items
+
+    merge_three_way.main()
+
+    merged = pd.read_csv(data_dir / "jpt.csv")
+    assert merged["url"].tolist() == ["https://jpt.spe.org/two", "https://jpt.spe.org/one"]
+
+
+def test_main_keeps_scraped_at_with_mixed_offsets(data_dir):
+    header = "excerpt,published_date,refresh_existing,scraped_at,tags,title,topics,url\n"
+    (data_dir / "jpt_master.csv").write_text(
+        header + "A,2026-01-02,0,2026-01-02T00:00:00+05:00,t,One,x,https://jpt.spe.org/one\n"
+    )
+    (data_dir / "jpt_daily.csv").write_text(
+        header + "B,2026-01-03,0,2026-01-03T00:00:00+00:00,t,Two,x,https://jpt.spe.org/two\n"
+    )
+
+    merge_three_way.main()
+
+    merged = pd.read_csv(data_dir / "jpt.csv")
+    assert merged["scraped_at"].notna().all()
+
+
+NAT = np.iinfo(np.int64).min  # datetime64 NaT viewed as int64
+
+
+def latest(urls, scraped_ns):
+    return merge_three_way.latest_row_per_url(
+        np.array(urls, dtype=object), np.array(scraped_ns, dtype=np.int64)
+    ).tolist()
+
+
+def test_latest_row_per_url_keeps_newest_scrape():
+    assert latest(["a", "b", "a"], [2, 1, 1]) == [0, 1]
+
+
+def test_latest_row_per_url_later_row_wins_ties():
+    # DAILY rows come after MASTER rows, so DAILY wins an equal scraped_at
+    assert latest(["a", "a"], [5, 5]) == [1]
+
+
+def test_latest_row_per_url_nat_counts_as_oldest():
+    assert latest(["a", "a"], [1, NAT]) == [0]
+    assert latest(["a", "a"], [NAT, 1]) == [1]
+    assert latest(["a", "a"], [NAT, NAT]) == [1]
+
+
+def test_latest_row_per_url_groups_missing_urls_together():
+    assert latest([np.nan, "b", np.nan], [1, 1, 2]) == [1, 2]
+
+
+def test_main_daily_wins_tied_scrape(data_dir):
+    header = "excerpt,published_date,refresh_existing,scraped_at,tags,title,topics,url\n"
+    row = "E,2026-01-02,0,2026-01-02T00:00:00+00:00,t,{},x,https://jpt.spe.org/one\n"
+    (data_dir / "jpt_master.csv").write_text(header + row.format("Old"))
+    (data_dir / "jpt_daily.csv").write_text(header + row.format("New"))
+
+    merge_three_way.main()
+
+    merged = pd.read_csv(data_dir / "jpt.csv")
+    assert merged["title"].tolist() == ["New"]
+
+
+def order(*keys):
+    return merge_three_way.descending_order([np.array(k, dtype=np.int64) for k in keys]).tolist()
+
+
+def test_descending_order_newest_first():
+    assert order([1, 3, 2]) == [1, 2, 0]
+
+
+def test_descending_order_puts_nat_last():
+    assert order([NAT, 1, 2]) == [2, 1, 0]
+
+
+def test_descending_order_breaks_ties_on_second_key():
+    published = [1, 1, 0, 1]
+    scraped = [1, 2, 5, NAT]
+    assert order(published, scraped) == [1, 0, 3, 2]
+
+
+def test_descending_order_is_stable_on_full_ties():
+    assert order([1, 1, NAT, NAT], [2, 2, 3, 3]) == [0, 1, 2, 3]
+
+
+def test_main_sorts_missing_published_date_last(data_dir):
+    header = "excerpt,published_date,refresh_existing,scraped_at,tags,title,topics,url\n"
+    (data_dir / "jpt_master.csv").write_text(
+        header
+        + "A,,0,2026-01-05T00:00:00+00:00,t,Undated,x,https://jpt.spe.org/undated\n"
+        + "B,2026-01-01,0,2026-01-02T00:00:00+00:00,t,Older,x,https://jpt.spe.org/older\n"
+        + "C,2026-01-03,0,,t,NoScrape,x,https://jpt.spe.org/noscrape\n"
+        + "D,2026-01-03,0,2026-01-04T00:00:00+00:00,t,Newer,x,https://jpt.spe.org/newer\n"
+    )
+
+    merge_three_way.main()
+
+    merged = pd.read_csv(data_dir / "jpt.csv")
+    assert merged["title"].tolist() == ["Newer", "NoScrape", "Older", "Undated"]